@@ -1,24 +1,43 @@
-from fastapi import FastAPI, Request
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+from fastapi import FastAPI
 
 from starlette.staticfiles import StaticFiles
 from app.routers import app_router
-from app.utils.session_utils import SessionUtils, SESSION_COOKIE_NAME
-cw_chat_app = FastAPI()
+from app.services.session_store import open_session_store, close_session_store
+from app.utils.session_utils import WS_PER_MESSAGE_DEFLATE
+
 
-cw_chat_app.mount("/static", StaticFiles(directory="static"), name="static")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Why: one Redis connection pool per worker, opened/closed with the app
+    await open_session_store()
+    yield
+    await close_session_store()
 
-@cw_chat_app.middleware("http")
-async def inject_session_cookie(request: Request, call_next):
-    # Why: Ensure every visitor gets a stable session id
-    session_id = request.cookies.get(SESSION_COOKIE_NAME)
-    new_session = False
-    if not session_id:
-        session_id = SessionUtils.get_or_create_session_id(None)
-        new_session = True
+cw_chat_app = FastAPI(lifespan=lifespan)
 
-    response = await call_next(request)
-    if new_session:
-        SessionUtils.set_session_cookie(response, session_id)
-    return response
+# Why: resolve against this package, not the cwd, so both `uvicorn app.main:cw_chat_app` and
+# `python -m app.main` work from the repo root
+cw_chat_app.mount("/static", StaticFiles(directory=Path(__file__).resolve().parent / "static"), name="static")
 
 cw_chat_app.include_router(app_router.chat_app_router)
+
+
+if __name__ == "__main__":
+    import os
+    import uvicorn
+
+    # Why: uvloop + httptools (shipped with uvicorn[standard]) cut per-frame event-loop overhead on the WS path;
+    # permessage-deflate stays off unless CW_CHAT_WS_PER_MESSAGE_DEFLATE=1 (see SessionUtils._encode_frame)
+    uvicorn.run(
+        "app.main:cw_chat_app",
+        host=os.getenv("CW_CHAT_HOST", "127.0.0.1"),
+        port=int(os.getenv("CW_CHAT_PORT", "8000")),
+        workers=int(os.getenv("CW_CHAT_WORKERS", "1")),
+        loop="uvloop",
+        http="httptools",
+        ws="websockets",
+        ws_per_message_deflate=WS_PER_MESSAGE_DEFLATE,
+    )
@@ -1,11 +1,9 @@
-from typing import Optional, Dict, List
-from dataclasses import dataclass, asdict
+from typing import Optional, Dict
+from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ChatMessage:
     role: str
     content: str
     at: str
-    meta: Optional[Dict[str, any]] = None
-
-MemoryStore: Dict[str, List[ChatMessage]] = {}
\ No newline at end of file
+    meta: Optional[Dict[str, any]] = None
\ No newline at end of file
@@ -1,21 +1,35 @@
+import asyncio
+import functools
+import logging
+
 from fastapi import APIRouter, Request, Cookie, WebSocket, WebSocketDisconnect
 from fastapi.templating import Jinja2Templates
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache, select_autoescape
 from dependency_injector.wiring import inject, Provide
-from typing import Optional
-import secrets
+from typing import AsyncGenerator, Optional
+import os
+from pathlib import Path
 from fastapi.responses import HTMLResponse, RedirectResponse
 from datetime import datetime, timezone
 
-from app.services.ollama_llm import OllamaLLMService
 from app.services.ollama_llm_chat import OllamaLLMChatService
-from app.utils.session_utils import SESSION_COOKIE_NAME, SessionUtils
+from app.utils.session_utils import SESSION_COOKIE_NAME, WS_OUTBOX_SIZE, SessionUtils
 from app.utils.date_utils import DateUtil
-from app.models.chat_message import ChatMessage, MemoryStore
+from app.models.chat_message import ChatMessage
+from app.services.session_store import get_session_store
 chat_app_router = APIRouter(
     prefix="/app"
 )
 
-templates = Jinja2Templates(directory="templates")
+# Why: compile templates once per process (bytecode cache is shared across workers/restarts),
+# and skip the per-render mtime check on template sources
+templates = Jinja2Templates(env=Environment(
+    loader=FileSystemLoader(Path(__file__).resolve().parent.parent / "templates"),
+    autoescape=select_autoescape(),
+    bytecode_cache=FileSystemBytecodeCache(),
+    auto_reload=False,
+))
+# Why: single shared instance per worker so the Ollama HTTP connection pool is reused across sockets
 chat_service = OllamaLLMChatService()
 
 @chat_app_router.get("/", response_class=RedirectResponse)
@@ -27,84 +41,99 @@ async def root():
 @inject
 async def chat_page(request: Request, session_id: Optional[str] = Cookie(default=None, alias=SESSION_COOKIE_NAME)):
     sid = SessionUtils.get_or_create_session_id(session_id)
-    # First time visitors still get cookie via middleware; we also pass sid to template for initial state
+    # Pass sid to template for initial state; WS hello echoes it back
     parms = {
-        "request": request,
         "session_id": sid,
-        "nonce": secrets.token_urlsafe(16),  # CSP nonce if you add CSP
+        "nonce": os.urandom(12).hex(),  # CSP nonce if you add CSP
         "title": "Web ChatBot",
     }
-    return templates.TemplateResponse("chat.html", parms)
+    response = templates.TemplateResponse(request, "chat.html", parms)
+    if sid != session_id:
+        # Why: only first-time (or invalid-cookie) visitors need Set-Cookie; static/WS requests never pay for it
+        SessionUtils.set_session_cookie(response, sid)
+    return response
 
 
 @chat_app_router.websocket("/ws")
 async def ws_chat(websocket: WebSocket):
     # Accept ASAP for handshake reliability
     await websocket.accept()
+    # Why: all outbound frames go through one queue + writer task so bursts are sent as one frame
+    out_q: asyncio.Queue = asyncio.Queue(maxsize=WS_OUTBOX_SIZE)
+    writer = asyncio.create_task(SessionUtils.ws_writer(websocket, out_q))
+    # Why: raises the writer's send error instead of blocking on a full outbox once the writer is gone
+    send = functools.partial(SessionUtils.outbox_put, out_q, writer)
     try:
         # Expect a hello with session id
-        hello = await websocket.receive_json()
+        hello = await SessionUtils.ws_receive(websocket)
         if not isinstance(hello, dict) or hello.get("type") != "cw_chat_hello":
             await websocket.close(code=1002)
             return
-        session_id = hello.get("session_id") or SessionUtils.get_or_create_session_id(None)
+        # Why: cookie is read once per connection; hello's id covers clients without the cookie
+        session_id = SessionUtils.get_or_create_session_id(
+            websocket.cookies.get(SESSION_COOKIE_NAME) or hello.get("session_id")
+        )
+        store = get_session_store()
 
         while True:
-            event = await websocket.receive_json()
+            event = await SessionUtils.ws_receive(websocket)
             etype = event.get("type")
 
             if etype == "user_message":
                 text = (event.get("text") or "").strip()
                 if not text:
-                    await websocket.send_json({"type": "error", "error": "Message is empty."})
+                    await send({"type": "error", "error": "Message is empty."})
                     continue
 
-                # Save user message
-                MemoryStore.setdefault(session_id, []).append(
-                    ChatMessage(role="user", content=text, at=DateUtil.now_datetime_iso())
-                )
-                await websocket.send_json({"type": "ack"})
+                now_iso = DateUtil.now_datetime_iso()
+
+                # Why: persist the user's message on arrival so history reads during the reply include it
+                await store.append(session_id, ChatMessage(role="user", content=text, at=now_iso))
+                await send({"type": "ack"})
 
                 # Typing start
-                await websocket.send_json({"type": "typing", "state": True})
-
-                # Demo file payload (if provided)
-                f = event.get("file")
-                if f and isinstance(f, dict):
-                    name = f.get("name")
-                    size = f.get("size")
-                    # Attach a synthetic assistant note acknowledging receipt
-                    MemoryStore[session_id].append(
-                        ChatMessage(
-                            role="assistant",
-                            content=f"(Received file: {name}, {size} bytes)",
-                            at=DateUtil.now_datetime_iso(),
-                            meta={"kind": "file-receipt"},
+                await send({"type": "typing", "state": True})
+
+                # Assistant messages of this turn; persisted in one round trip below
+                turn = []
+                try:
+                    # Demo file payload (if provided)
+                    f = event.get("file")
+                    if f and isinstance(f, dict):
+                        name = f.get("name")
+                        size = f.get("size")
+                        # Attach a synthetic assistant note acknowledging receipt
+                        turn.append(
+                            ChatMessage(
+                                role="assistant",
+                                content=f"(Received file: {name}, {size} bytes)",
+                                at=now_iso,
+                                meta={"kind": "file-receipt"},
+                            )
+                        )
+                        await send(
+                            {"type": "assistant_message", "message": {"role": "assistant", "content": f"(Received {name}, {size} bytes)"}}
                         )
-                    )
-                    await websocket.send_json(
-                        {"type": "assistant_message", "message": {"role": "assistant", "content": f"(Received {name}, {size} bytes)"}}
-                    )
-
-                # Build assistant reply
-                reply = await chat_bot_reply(text)
-
-                # Stream assistant reply
-                await SessionUtils.stream_assistant(websocket, reply)
 
-                # Save assistant message
-                MemoryStore.setdefault(session_id, []).append(
-                    ChatMessage(role="assistant", content=reply, at=DateUtil.now_datetime_iso())
-                )
+                    # Stream assistant reply as the model produces it
+                    reply = await SessionUtils.stream_tokens(out_q, writer, chat_bot_reply(text))
+                    turn.append(ChatMessage(role="assistant", content=reply, at=DateUtil.now_datetime_iso()))
+                finally:
+                    # Why: keep whatever was produced even if the reply fails mid-stream; a Redis error
+                    # here is logged so it can't replace the LLM/socket error being raised
+                    try:
+                        await store.append(session_id, *turn)
+                    except Exception:
+                        logging.exception("Failed to persist chat turn for session %s", session_id)
 
                 # Typing end
-                await websocket.send_json({"type": "typing", "state": False})
+                await send({"type": "typing", "state": False})
 
             elif etype == "ping":
-                await websocket.send_json({"type": "pong"})
+                await send({"type": "pong"})
 
             else:
-                await websocket.send_json({"type": "error", "error": f"Unknown event: {etype}"})
+                await send({"type": "error", "error": f"Unknown event: {etype}"})
 
     except WebSocketDisconnect:
         # Client disconnected; nothing to do
@@ -112,11 +141,13 @@ async def ws_chat(websocket: WebSocket):
     except Exception as exc:
         # Defensive error surface to client
         try:
-            await websocket.send_json({"type": "error", "error": f"Server error: {exc}"})
+            await SessionUtils.close_outbox(out_q, writer, {"type": "error", "error": f"Server error: {exc}"})
         except Exception:
             pass
         finally:
             await websocket.close(code=1011)
+    finally:
+        writer.cancel()
 
-async def chat_bot_reply(user_text: str) -> str:
-    return chat_service.invoke(user_text)
\ No newline at end of file
+def chat_bot_reply(user_text: str) -> AsyncGenerator[str, None]:
+    return chat_service.astream(user_text)
\ No newline at end of file
@@ -1,12 +1,14 @@
+import asyncio
+import itertools
 import logging
 import os
 import zipfile
 import tempfile
 from enum import Enum
-from langchain_community.document_loaders import TextLoader, PyPDFLoader, UnstructuredWordDocumentLoader, \
-    UnstructuredExcelLoader, UnstructuredPowerPointLoader
+from langchain_community.document_loaders import TextLoader, PyPDFLoader, PyMuPDFLoader, \
+    UnstructuredWordDocumentLoader, UnstructuredExcelLoader, UnstructuredPowerPointLoader
 from langchain_core.documents import Document
-from typing import List
+from typing import Dict, List, Tuple
 
 from app.utils.string_utils import StringUtils
 
@@ -19,36 +21,51 @@ class FILE_TYPE(Enum):
     MS_POWERPOINT = 5
     ZIP = 6
 
+
+FILE_TYPE_EXTS: Dict[FILE_TYPE, Tuple[str, ...]] = {
+    FILE_TYPE.TEXT: ("txt",),
+    FILE_TYPE.PDF: ("pdf",),
+    FILE_TYPE.MS_WORD: ("doc", "docx"),
+    FILE_TYPE.MS_EXCEL: ("xls", "xlsx"),
+    FILE_TYPE.MS_POWERPOINT: ("ppt", "pptx"),
+    FILE_TYPE.ZIP: ("zip",),
+}
+
+# Why: static mapping, built once at import; accepts both "txt" and ".txt"
+EXT_TO_TYPE: Dict[str, FILE_TYPE] = {
+    key: file_type
+    for file_type, exts in FILE_TYPE_EXTS.items()
+    for ext in exts
+    for key in (ext, f".{ext}")
+}
+
+# Why: str.endswith takes a tuple, so each type check is a single C call
+FILE_TYPE_SUFFIXES: Dict[FILE_TYPE, Tuple[str, ...]] = {
+    file_type: tuple(f".{ext}" for ext in exts) for file_type, exts in FILE_TYPE_EXTS.items()
+}
+
+
+# Why: pypdf is pure Python; PyMuPDF (C extension, needs `pymupdf` installed) is several times faster on large PDFs
+PDF_LOADERS = {
+    "pypdf": PyPDFLoader,
+    "pymupdf": PyMuPDFLoader,
+}
+PDF_BACKEND = os.getenv("PDF_BACKEND", "pypdf").lower()
+
+
 class FileLoadService:
     def __init__(self):
         self.default_encoding = 'utf-8'
-        self.file_types = {
-            FILE_TYPE.TEXT: {"ext": ["txt"]},
-            FILE_TYPE.PDF: {"ext": ["pdf"]},
-            FILE_TYPE.MS_WORD: {"ext": ["doc", "docx"]},
-            FILE_TYPE.MS_EXCEL: {"ext": ["xls", "xlsx"]},
-            FILE_TYPE.MS_POWERPOINT: {"ext": ["ppt", "pptx"]},
-            FILE_TYPE.ZIP: {"ext": ["zip"]}
-        }
-
-        self.ext_types = self._map_to_ext()
+        self.pdf_loader = PDF_LOADERS.get(PDF_BACKEND)
+        if self.pdf_loader is None:
+            logging.warning(f'unknown PDF_BACKEND {PDF_BACKEND!r}, expected one of {sorted(PDF_LOADERS)}; using pypdf')
+            self.pdf_loader = PyPDFLoader
 
     def get_file_type_by_ext(self, ext: str):
-        if ext in self.ext_types:
-            return self.ext_types[ext]
-        return None
-
-    def _map_to_ext(self):
-        ext_file_type_map = {}
-        for file_type in self.file_types:
-            for ext in self.file_types[file_type]['ext']:
-                ext_file_type_map[ext] = file_type
-                if not ext.startswith('.'):
-                    ext_file_type_map[f'.{ext}'] = file_type
-        return ext_file_type_map
+        return EXT_TO_TYPE.get(ext)
 
     def _is_end_with(self, file_type: FILE_TYPE, file_path: str):
-        return any(file_path.endswith(ext) for ext in self.file_types[file_type]['ext'])
+        return file_path.endswith(FILE_TYPE_SUFFIXES[file_type])
 
     def _load_txt(self, file_path: str):
         if self._is_end_with(FILE_TYPE.TEXT, file_path):
@@ -58,28 +75,28 @@ class FileLoadService:
             return []
 
     def _load_pdf(self, file_path):
-        if self._is_end_with(FILE_TYPE.TEXT, file_path):
-            loader = PyPDFLoader(file_path)
+        if self._is_end_with(FILE_TYPE.PDF, file_path):
+            loader = self.pdf_loader(file_path)
             return loader.load()
         else:
             return []
 
     def _load_ms_word(self, file_path):
-        if self._is_end_with(FILE_TYPE.TEXT, file_path):
-            loader = UnstructuredPowerPointLoader(file_path)
+        if self._is_end_with(FILE_TYPE.MS_WORD, file_path):
+            loader = UnstructuredWordDocumentLoader(file_path)
             return loader.load()
         else:
             return []
 
     def _load_ms_excel(self, file_path):
-        if self._is_end_with(FILE_TYPE.TEXT, file_path):
+        if self._is_end_with(FILE_TYPE.MS_EXCEL, file_path):
             loader = UnstructuredExcelLoader(file_path)
             return loader.load()
         else:
             return []
 
     def _load_ms_power_point(self, file_path):
-        if self._is_end_with(FILE_TYPE.TEXT, file_path):
+        if self._is_end_with(FILE_TYPE.MS_POWERPOINT, file_path):
             loader = UnstructuredPowerPointLoader(file_path)
             return loader.load()
         else:
@@ -89,17 +106,22 @@ class FileLoadService:
         if not self._is_end_with(FILE_TYPE.ZIP, zip_path):
             return []
 
-        documents = []
         with tempfile.TemporaryDirectory() as temp_dir:
             logging.info(f'extracting zip file to {temp_dir}')
+            file_paths = []
             with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                zip_ref.extractall(temp_dir)
-            documents.extend(self.load_all(temp_dir))
-        return documents
+                # Why: loaders need real paths, but only entries we can load are worth writing to disk
+                for info in zip_ref.infolist():
+                    if info.is_dir():
+                        continue
+                    if os.path.splitext(info.filename)[1] not in EXT_TO_TYPE:
+                        continue
+                    file_paths.append(zip_ref.extract(info, temp_dir))
+            return self._load_paths(file_paths)
 
     def _load_file(self, file_name):
         root, extension = os.path.splitext(file_name)
-        file_type = self.ext_types[extension]
+        file_type = EXT_TO_TYPE.get(extension)
         match file_type:
             case FILE_TYPE.TEXT:
                 return self._load_txt(file_name)
@@ -116,15 +138,21 @@ class FileLoadService:
             case _:
                 return []
 
-    def load_all(self, path, recursive=False):
+    def _load_paths(self, file_paths: List[str]) -> List[Document]:
         documents: List[Document] = []
-
-        file_paths = StringUtils.get_file_paths(path, recursive)
         for file_path in file_paths:
-            file_path.replace('\\', '/')
             documents.extend(self._load_file(file_path))
         return documents
 
+    async def load_all(self, path, recursive=False) -> List[Document]:
+        """
+        Load every supported file under path.
+        Why: loaders block on I/O + parsing, so fan files out to worker threads instead of loading them one by one.
+        """
+        file_paths = StringUtils.get_file_paths(path, recursive)
+        results = await asyncio.gather(*(asyncio.to_thread(self._load_file, p) for p in file_paths))
+        return list(itertools.chain.from_iterable(results))
+
     def load(self, file_path):
         documents: List[Document] = []
 
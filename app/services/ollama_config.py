@@ -0,0 +1,4 @@
+import httpx
+
+# Why: one keep-alive pool per service instance; create the service once per process and share it
+OLLAMA_CLIENT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
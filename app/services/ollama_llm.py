@@ -1,9 +1,9 @@
 from langchain_ollama import OllamaLLM
-import pprint
+from app.services.ollama_config import OLLAMA_CLIENT_LIMITS
 
 class OllamaLLMService:
     def __init__(self):
-        self.llm = OllamaLLM(model="llama3")
+        self.llm = OllamaLLM(model="llama3", client_kwargs={"limits": OLLAMA_CLIENT_LIMITS})
 
     def invoke(self, prompt):
         return self.llm.invoke(prompt)
\ No newline at end of file
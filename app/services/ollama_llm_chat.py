@@ -1,22 +1,56 @@
+import functools
+from typing import AsyncGenerator
+
 from langchain_ollama.chat_models import ChatOllama
-from langchain_core.messages import HumanMessage
+from langchain_core.messages import HumanMessage, SystemMessage
+from app.services.ollama_config import OLLAMA_CLIENT_LIMITS
 from app.services.system_message_store import SystemMessageStore
+from app.utils.date_utils import DateUtil
+
+SYSTEM_MESSAGE_KEY = "engineering.no_hallucinations.concise"
+SYSTEM_MESSAGE_TIMEZONE = "America/Toronto"
+
+
+@functools.lru_cache(maxsize=64)
+def _render_system_message(key: str, knowledge_cutoff: str, today: str, timezone: str, jurisdiction: str,
+                           max_words: int) -> SystemMessage:
+    """Why: rendering is deterministic in its args; 'today' in the key re-renders once per day."""
+    return SystemMessageStore().render_system_message(
+        key,
+        knowledge_cutoff=knowledge_cutoff,
+        today=today,
+        timezone=timezone,
+        jurisdiction=jurisdiction,
+        max_words=max_words,
+    )
 
 
 class OllamaLLMChatService:
-    def __init__(self):
-        self.chat_model = ChatOllama(model="llama3")
-        self.system_message_store = SystemMessageStore()
-        self.system_msg = self.system_message_store.render_system_message(
-            "engineering.no_hallucinations.concise",
-            knowledge_cutoff="2025-06-01",  # Required cutoff date
-            today="2025-11-10",  # Current date
-            timezone="America/Toronto",  # Timezone for date calculations
-            jurisdiction="SOX/PCI",  # Compliance requirement
-            max_words=500
+    @functools.cached_property
+    def chat_model(self) -> ChatOllama:
+        # Why: defer client construction to first use; keeps import/worker start-up cheap
+        return ChatOllama(model="llama3", client_kwargs={"limits": OLLAMA_CLIENT_LIMITS})
+
+    @property
+    def system_msg(self) -> SystemMessage:
+        return _render_system_message(
+            SYSTEM_MESSAGE_KEY,
+            "2025-06-01",  # Required cutoff date
+            DateUtil.now_date_iso(SYSTEM_MESSAGE_TIMEZONE),  # Current date in business timezone
+            SYSTEM_MESSAGE_TIMEZONE,  # Timezone for date calculations
+            "SOX/PCI",  # Compliance requirement
+            500,  # max_words
         )
 
     def invoke(self, prompt: str):
         prompts = [self.system_msg, HumanMessage(prompt)]
         response = self.chat_model.invoke(prompts)
         return response.content
+
+
+    async def astream(self, prompt: str) -> AsyncGenerator[str, None]:
+        """Why: stream tokens without blocking the event loop shared by every open WebSocket."""
+        prompts = [self.system_msg, HumanMessage(prompt)]
+        async for chunk in self.chat_model.astream(prompts):
+            if chunk.content:
+                yield chunk.content
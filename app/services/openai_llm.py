@@ -1,7 +1,8 @@
 from langchain_openai.llms import OpenAI
-import pprint
 
-model = OpenAI(model="gpt-5-mini")
-out = model.invoke("Say this is a test")
+class OpenAILLMService:
+    def __init__(self):
+        self.llm = OpenAI(model="gpt-5-mini")
 
-pprint.pprint(out)
\ No newline at end of file
+    def invoke(self, prompt):
+        return self.llm.invoke(prompt)
\ No newline at end of file
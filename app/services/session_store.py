@@ -0,0 +1,66 @@
+import os
+from dataclasses import asdict
+from typing import List, Optional
+
+import orjson
+from redis.asyncio import Redis
+
+from app.models.chat_message import ChatMessage
+
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+SESSION_KEY_PREFIX = "chat:"
+SESSION_TTL_SECONDS = 60 * 60  # 1 hour
+SESSION_MAX_MESSAGES = int(os.getenv("SESSION_MAX_MESSAGES", "200"))  # rolling window per session
+
+_store: Optional["SessionStore"] = None
+
+
+class SessionStore:
+    """
+    Chat history per session, kept as a Redis LIST of JSON encoded ChatMessage.
+    Why: bounded by TTL, eviction and a rolling window of SESSION_MAX_MESSAGES;
+    shared across uvicorn workers (no sticky sessions).
+    """
+
+    def __init__(self, client: Redis):
+        self.client = client
+
+    @staticmethod
+    def _key(session_id: str) -> str:
+        return f"{SESSION_KEY_PREFIX}{session_id}"
+
+    async def append(self, session_id: str, *messages: ChatMessage) -> None:
+        """Why: one pipelined round trip per chat turn instead of RPUSH + EXPIRE per message."""
+        if not messages:
+            return
+        key = self._key(session_id)
+        async with self.client.pipeline(transaction=False) as pipe:
+            for message in messages:
+                pipe.rpush(key, orjson.dumps(asdict(message)))
+            pipe.ltrim(key, -SESSION_MAX_MESSAGES, -1)
+            pipe.expire(key, SESSION_TTL_SECONDS)
+            await pipe.execute()
+
+    async def get_history(self, session_id: str) -> List[ChatMessage]:
+        items = await self.client.lrange(self._key(session_id), 0, -1)
+        return [ChatMessage(**orjson.loads(item)) for item in items]
+
+
+async def open_session_store(url: str = REDIS_URL) -> SessionStore:
+    global _store
+    if _store is None:
+        _store = SessionStore(Redis.from_url(url))
+    return _store
+
+
+async def close_session_store() -> None:
+    global _store
+    if _store is not None:
+        await _store.client.aclose()
+        _store = None
+
+
+def get_session_store() -> SessionStore:
+    if _store is None:
+        raise RuntimeError("Session store is not open; start the app through its lifespan.")
+    return _store
@@ -19,21 +19,25 @@ LangChain compatibility:
 """
 
 from __future__ import annotations
+import functools
 import json
+import keyword
 import os
+import string
 from datetime import date, datetime, timezone as dt_timezone
-from dataclasses import dataclass, asdict, field, fields
-from typing import Dict, List, Tuple, Mapping, Any, Optional
+from dataclasses import dataclass, field, fields
+from typing import Callable, ClassVar, Dict, List, Tuple, Mapping, Any, Optional
 from langchain_core.messages import SystemMessage  # modern
 from langchain_core.prompts import ChatPromptTemplate
 import yaml
 from enum import Enum
+from types import MappingProxyType
 from zoneinfo import ZoneInfo  # py>=3.9
 import pprint
 from app.utils.date_utils import DateUtil
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TemplateParam:
     """
     Defaults chosen to be safe and non-misleading.
@@ -49,6 +53,10 @@ class TemplateParam:
     today: str = field(default_factory=lambda: date.today().isoformat())
     timezone: str = "UTC"  # NEW: default to UTC
 
+    # Filled in after the class body; avoids fields() reflection per call.
+    _FIELD_NAMES: ClassVar[Tuple[str, ...]]
+    _FIELD_NAMES_SET: ClassVar[frozenset[str]]
+
     @classmethod
     def from_partial(
             cls,
@@ -58,10 +66,11 @@ class TemplateParam:
         """
         Merge partial values, fill defaults, normalize timezone, and compute 'today' from timezone when missing.
         """
+        # why: one pass keeping only known fields (overrides win); no intermediate merged copy of data
         payload: Dict[str, Any] = {}
-        if data:
-            payload.update(dict(data))
-        payload.update(overrides)
+        for source in (data or {}, overrides):
+            for k in cls._FIELD_NAMES_SET & source.keys():
+                payload[k] = source[k]
 
         # Normalize timezone early; tolerate unknown/bad values.
         tz = DateUtil.normalize_timezone(payload.get("timezone"))
@@ -78,16 +87,15 @@ class TemplateParam:
             payload.get("today"), default=td_default
         )
 
-        # Keep only known fields; dataclass injects remaining defaults.
-        expected = {f.name for f in fields(cls)}
-        init_kwargs = {k: v for k, v in payload.items() if k in expected}
-        return cls(**init_kwargs)  # type: ignore[arg-type]
+        # Only known fields were collected; dataclass injects remaining defaults.
+        return cls(**payload)  # type: ignore[arg-type]
 
     def to_kwargs(self, *, extra: Optional[Mapping[str, Any]] = None) -> Dict[str, Any]:
         """
         why: produce a dict for template rendering; allow pass-through extras if needed.
         """
-        out = asdict(self)
+        # why: fields are flat strings, so a shallow read is equivalent to asdict() without its deepcopy/reflection
+        out = {name: getattr(self, name) for name in self._FIELD_NAMES}
         if extra:
             for k, v in extra.items():
                 if k not in out or out[k] in (None, "", []):
@@ -95,7 +103,11 @@ class TemplateParam:
         return out
 
 
-@dataclass(frozen=True)
+TemplateParam._FIELD_NAMES = tuple(f.name for f in fields(TemplateParam))
+TemplateParam._FIELD_NAMES_SET = frozenset(TemplateParam._FIELD_NAMES)
+
+
+@dataclass(frozen=True, slots=True)
 class Template:
     key: str
     category: str
@@ -104,7 +116,7 @@ class Template:
     template: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RoleSpec:
     title: str
     responsibility: str
@@ -147,7 +159,7 @@ class SystemMessageStore:
         'Members benefit from an all-in-one experience that combines multiple account types into a single dashboard, offers automated savings, life-stage-aligned investments, retirement projections, and accessible expert guidance. '
         'Employers gain a fully digital setup and administration process, while advisors receive turnkey onboarding and reporting tools to grow their client base.')
 
-    _ROLES: Dict[str, RoleSpec] = {
+    _ROLES: Mapping[str, RoleSpec] = {
         "sales": RoleSpec(
             title="Retirement Solutions Sales Advisor",
             responsibility="member and employer acquisition for retirement plans",
@@ -190,7 +202,7 @@ class SystemMessageStore:
         ),
     }
 
-    _BASE_VARIANTS: Dict[str, str] = {
+    _BASE_VARIANTS: Mapping[str, str] = {
         "concise": " Keep the response concise (≤ {max_words} words).",
         "detailed": " Provide structured, actionable steps with short reasoning.",
         "tool_first": " Use tools or retrieved evidence before answering; cite the results clearly.",
@@ -203,7 +215,7 @@ class SystemMessageStore:
         "multilingual": " Respond in the user's language ({locale}) when possible; otherwise default to {default_language}.",
     }
 
-    _EXTRA_VARIANTS: Dict[str, Dict[str, str]] = {
+    _EXTRA_VARIANTS: Mapping[str, Mapping[str, str]] = {
         "sales": {
             "value_framing": (
                 " Frame explanations around member and employer outcomes, emphasizing retirement readiness, cost efficiency, "
@@ -255,16 +267,31 @@ class SystemMessageStore:
         },
     }
 
+    # Filled in after the class body: role -> merged base + role variants ("_base" for roles without extras).
+    _MERGED_VARIANTS: Mapping[str, Mapping[str, str]]
+    _ALL_KEYS: Tuple[str, ...]
+    _TEMPLATED_VARIANTS: frozenset[str]
+    _COMPILED_VARIANTS: Dict[str, Callable[..., str]]
+    # Filled in next to _intro_line: role -> intro format string, by product/service/neither.
+    _INTRO_TMPL_PRODUCT: Dict[str, str]
+    _INTRO_TMPL_SERVICE: Dict[str, str]
+    _INTRO_TMPL_NONE: Dict[str, str]
+
     """Dynamic SystemMessage builder with optional identity/compliance/product/service."""
 
     def keys(self) -> List[str]:
-        keys: List[str] = []
-        for c in self.roles.keys():
-            for v in _all_variants_for(c).keys():
-                keys.append(f"{c}.{v}")
-        return keys
+        return list(self._ALL_KEYS)
 
-    def _get_role_and_variants(self, key: str) -> Tuple[str, List[str]]:
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop memoized renders (e.g. between tests or after patching class-level catalogs)."""
+        _render_content_cached.cache_clear()
+        _compliance_line.cache_clear()
+        _system_message.cache_clear()
+        _chat_prompt_template.cache_clear()
+
+    @classmethod
+    def _get_role_and_variants(cls, key: str) -> Tuple[str, List[str]]:
         """
         Parse key string into role and variant list.
 
@@ -282,7 +309,7 @@ class SystemMessageStore:
         role = splits[0]
         variants = splits[1:]
 
-        if role not in self._ROLES:
+        if role not in cls._ROLES:
             raise KeyError(f"Unknown category '{role}'.")
 
         return role, variants
@@ -307,36 +334,70 @@ class SystemMessageStore:
             max_words: int = 120,
             **extra_fmt: Any,
     ) -> str:
-        company = _value_or_default(company, self._COMPANY_NAME)
-        industry = _value_or_default(industry, self._INDUSTRY)
-        business_area = _value_or_default(business_area, self._BUSINESS_AREA)
+        """
+        Render the system prompt for key. Results are memoized on the full argument tuple
+        ('today' is resolved first so a cached render never outlives its date).
+        """
+        args = (key, company, industry, product, service, business_area, jurisdiction, policy_url,
+                knowledge_cutoff, today if today is not None else DateUtil.now_date_iso(), timezone,
+                locale, default_language, max_words, tuple(sorted(extra_fmt.items())))
+        try:
+            return _render_content_cached(type(self), *args)
+        except TypeError:
+            # why: unhashable extra_fmt values cannot be cache keys; render without caching
+            return self._render_content(*args)
 
-        role, variants = self._get_role_and_variants(key)
+    @classmethod
+    def _render_content(
+            cls,
+            key: str,
+            company: str | None,
+            industry: str | None,
+            product: str | None,
+            service: str | None,
+            business_area: str | None,
+            jurisdiction: str | None,
+            policy_url: str | None,
+            knowledge_cutoff: str,
+            today: str,
+            timezone: str,
+            locale: str,
+            default_language: str,
+            max_words: int,
+            extra_fmt: Tuple[Tuple[str, Any], ...],
+    ) -> str:
+        # Why: an empty name is never meaningful here, so plain `or` falls back without an extra call
+        company = company or cls._COMPANY_NAME
+        industry = industry or cls._INDUSTRY
+        business_area = business_area or cls._BUSINESS_AREA
+
+        role, variants = cls._get_role_and_variants(key)
 
         intro = _intro_line(company, role, industry=industry, company_business_area=business_area, product=product, service=service)
-        tasks = self._ROLES[role].tasks_line
-        time_line = _time_line(knowledge_cutoff=knowledge_cutoff, today=today if today is not None else DateUtil.now_date_iso(),
-                               timezone=timezone)
-        compliance = _compliance_line(jurisdiction=jurisdiction, policy_url=policy_url)
+        tasks = cls._ROLES[role].tasks_line
+        time_line = _time_line(knowledge_cutoff=knowledge_cutoff, today=today, timezone=timezone)
+        compliance = _compliance_line(jurisdiction, policy_url)
 
         variant_map = _all_variants_for(role)
-        tails = []
+        tails: List[str] = []
         for variant in variants:
-            if variant in variant_map:
-                tail_template = variant_map[variant]
+            tail = variant_map.get(variant)
+            if not tail:
+                continue
+            if tail in cls._TEMPLATED_VARIANTS:
+                fmt_kwargs = dict(extra_fmt, max_words=max_words, locale=locale, default_language=default_language)
+                compiled = cls._COMPILED_VARIANTS.get(tail)
                 try:
-                    tail = tail_template.format(
-                        max_words=max_words, locale=locale, default_language=default_language, **extra_fmt
-                    )
+                    tail = compiled(**fmt_kwargs) if compiled else tail.format(**fmt_kwargs)
                 except Exception:
-                    tail = tail_template  # why: never break due to missing optional placeholders
-            else:
-                tail = ""
+                    pass  # why: never break due to missing optional placeholders
+            tails.append(tail.strip())
 
-        return (intro + " " + tasks + time_line + compliance + " " + tail).strip()
+        return " ".join(filter(None, [intro, tasks.strip(), time_line.strip(), compliance.strip(), *tails]))
 
     def render_system_message(self, key: str, **kwargs: Any) -> SystemMessage:
-        return SystemMessage(content=self.render_content(key, **kwargs))
+        """Shared per content (see _system_message): treat the returned message as read-only."""
+        return _system_message(self.render_content(key, **kwargs))
 
     @staticmethod
     def build_prompt_template(
@@ -346,11 +407,8 @@ class SystemMessageStore:
             include_history: bool = True,
             history_var: str = "history",
     ) -> ChatPromptTemplate:
-        msgs: List[Tuple[str, str]] = [("system", system_text)]
-        if include_history:
-            msgs.append(("placeholder", "{" + history_var + "}"))
-        msgs.append(("human", human))
-        return ChatPromptTemplate.from_messages(msgs)
+        """Shared per argument tuple (see _chat_prompt_template): treat the returned template as read-only."""
+        return _chat_prompt_template(system_text, human, include_history, history_var)
 
     def build_prompt_from_key(
             self,
@@ -367,6 +425,71 @@ class SystemMessageStore:
         # ---------- Loaders ----------
 
 
+# why: catalogs are aliased by cached renders and the precomputed maps below; read-only views make that safe
+SystemMessageStore._ROLES = MappingProxyType(SystemMessageStore._ROLES)
+SystemMessageStore._BASE_VARIANTS = MappingProxyType(SystemMessageStore._BASE_VARIANTS)
+SystemMessageStore._EXTRA_VARIANTS = MappingProxyType(
+    {role: MappingProxyType(extras) for role, extras in SystemMessageStore._EXTRA_VARIANTS.items()}
+)
+# why: variant catalogs are static; merge base + per-role extras once at import instead of per render
+SystemMessageStore._MERGED_VARIANTS = MappingProxyType({
+    "_base": SystemMessageStore._BASE_VARIANTS,
+    **{
+        role: MappingProxyType({**SystemMessageStore._BASE_VARIANTS, **SystemMessageStore._EXTRA_VARIANTS.get(role, {})})
+        for role in SystemMessageStore._ROLES
+    },
+})
+# why: "role.variant" keys are static; keys() copies this tuple instead of re-formatting every pair
+SystemMessageStore._ALL_KEYS = tuple(
+    f"{role}.{variant}"
+    for role, variant_map in SystemMessageStore._MERGED_VARIANTS.items()
+    if role != "_base"
+    for variant in variant_map
+)
+# why: only templates with placeholders need str.format; the rest are appended as-is
+SystemMessageStore._TEMPLATED_VARIANTS = frozenset(
+    template
+    for variant_map in SystemMessageStore._MERGED_VARIANTS.values()
+    for template in variant_map.values()
+    if "{" in template
+)
+
+
+def _compile_variant(template: str) -> Optional[Callable[..., str]]:
+    """
+    Compile a variant template into an f-string lambda taking its placeholders as keyword args.
+    why: str.format re-parses the template on every call; the compiled f-string is parsed once at import.
+    Returns None (caller falls back to str.format) for anything beyond plain `{name}`/`{name!r:spec}` fields.
+    """
+    body: List[str] = []
+    names: List[str] = []
+    try:
+        parsed = list(string.Formatter().parse(template))
+    except ValueError:
+        return None
+    for literal, name, spec, conversion in parsed:
+        body.append(literal.replace("{", "{{").replace("}", "}}"))
+        if name is None:
+            continue
+        if not name.isidentifier() or keyword.iskeyword(name) or any(c in spec for c in "{}'\"\\"):
+            return None
+        names.append(name)
+        body.append("{" + name + (f"!{conversion}" if conversion else "") + (f":{spec}" if spec else "") + "}")
+    params = ", ".join(sorted(set(names)))
+    source = f"lambda *, {params}, **_: f{''.join(body)!r}" if params else f"lambda **_: {template!r}"
+    try:
+        return eval(compile(source, "<variant template>", "eval"), {"__builtins__": {}})
+    except SyntaxError:
+        return None
+
+
+SystemMessageStore._COMPILED_VARIANTS = {
+    template: compiled
+    for template in SystemMessageStore._TEMPLATED_VARIANTS
+    if (compiled := _compile_variant(template)) is not None
+}
+
+
 def build_prompt(store: SystemMessageStore, key: str, **kwargs: Any) -> ChatPromptTemplate:
     """
     Build a ChatPromptTemplate using the dynamic renderer. Missing optional fields are handled.
@@ -375,15 +498,31 @@ def build_prompt(store: SystemMessageStore, key: str, **kwargs: Any) -> ChatProm
     return store.build_prompt_from_key(key, **kwargs)
 
 
-def _value_or_default(value: Any, default: Any) -> Any:
-    """Return value if not None, otherwise return default."""
-    return value if value is not None else default
+@functools.lru_cache(maxsize=256)
+def _system_message(content: str) -> SystemMessage:
+    """why: skip pydantic validation for repeat contents; messages are passed to models, never mutated."""
+    return SystemMessage(content=content)
+
+
+@functools.lru_cache(maxsize=256)
+def _chat_prompt_template(system_text: str, human: str, include_history: bool, history_var: str) -> ChatPromptTemplate:
+    """why: from_messages re-parses every message template; identical inputs always build the same prompt."""
+    msgs: List[Tuple[str, str]] = [("system", system_text)]
+    if include_history:
+        msgs.append(("placeholder", "{" + history_var + "}"))
+    msgs.append(("human", human))
+    return ChatPromptTemplate.from_messages(msgs)
+
 
+@functools.lru_cache(maxsize=512)
+def _render_content_cached(store_cls: type, *args: Any) -> str:
+    return store_cls._render_content(*args)
 
-def _all_variants_for(category: str) -> Dict[str, str]:
-    out = dict(SystemMessageStore._BASE_VARIANTS)
-    out.update(SystemMessageStore._EXTRA_VARIANTS.get(category, {}))
-    return out
+
+def _all_variants_for(category: str) -> Mapping[str, str]:
+    """Merged base + role variants, as a shared read-only view."""
+    merged = SystemMessageStore._MERGED_VARIANTS
+    return merged.get(category, merged["_base"])
 
 
 def _a_or_an(phrase: str) -> str:
@@ -391,31 +530,50 @@ def _a_or_an(phrase: str) -> str:
     return "an" if phrase[:1].lower() in {"a", "e", "i", "o", "u"} else "a"
 
 
-def _intro_line(company: str, role: str, *, industry: str | None, company_business_area: str | None, product: str | None,
-                service: str | None) -> str:
-    
-    role_spec = SystemMessageStore._ROLES[role]
-    parts = [f"You are {_a_or_an(role_spec.title)} {role_spec.title} at {company} in the {industry} industry, your responsibility is {role_spec.responsibility}"]
+def _intro_template(role_spec: RoleSpec, focus: str) -> str:
+    """
+    Precompute the intro sentence for a role with only per-call slots left ({company}, {industry}, {area},
+    {product}/{service}). Article, title, responsibility and tasks are fixed per role.
+    """
+    def esc(text: str) -> str:
+        return text.replace("{", "{{").replace("}", "}}")
 
-    if company_business_area:
-        parts.append(f". {company_business_area}")
+    head = (f"You are {_a_or_an(role_spec.title)} {esc(role_spec.title)} at {{company}} in the {{industry}} industry, "
+            f"your responsibility is {esc(role_spec.responsibility)}{{area}}")
+    return head + focus + " " + esc(role_spec.tasks_line)
 
-    if product:
-        parts.append(f"Now you work with the {product} product")
-    elif service:
-        parts.append(f"Not you provide {service} services")
 
+# why: one str.format per render instead of list building, branches and join
+SystemMessageStore._INTRO_TMPL_PRODUCT = {
+    role: _intro_template(spec, " Now you work with the {product} product") for role, spec in SystemMessageStore._ROLES.items()
+}
+SystemMessageStore._INTRO_TMPL_SERVICE = {
+    role: _intro_template(spec, " Not you provide {service} services") for role, spec in SystemMessageStore._ROLES.items()
+}
+SystemMessageStore._INTRO_TMPL_NONE = {
+    role: _intro_template(spec, "") for role, spec in SystemMessageStore._ROLES.items()
+}
 
-    parts.append(role_spec.tasks_line)
 
-    return " ".join(parts)
+def _intro_line(company: str, role: str, *, industry: str | None, company_business_area: str | None, product: str | None,
+                service: str | None) -> str:
+    area = f" . {company_business_area}" if company_business_area else ""
+    if product:
+        template = SystemMessageStore._INTRO_TMPL_PRODUCT[role]
+    elif service:
+        template = SystemMessageStore._INTRO_TMPL_SERVICE[role]
+    else:
+        template = SystemMessageStore._INTRO_TMPL_NONE[role]
+    return template.format(company=company, industry=industry, area=area, product=product, service=service)
 
 def _time_line(*, knowledge_cutoff: str, today: str, timezone: str) -> str:
     return f" Knowledge cutoff={knowledge_cutoff}. Today={today} {timezone}."
 
 
-def _compliance_line(*, jurisdiction: str | None, policy_url: str | None) -> str:
+@functools.lru_cache(maxsize=64)
+def _compliance_line(jurisdiction: str | None, policy_url: str | None) -> str:
     """
+    why: cached; jurisdiction/policy_url come from a handful of values, so most renders reuse a line.
     Optional compliance sentence. Removed if both are None.
     - Both present: 'Comply with {jurisdiction} policies and {policy_url}.'
     - Only jurisdiction: 'Comply with {jurisdiction} policies.'
@@ -438,11 +596,7 @@ def _variant_tail(variant: str) -> str:
 
 
 def _all_keys() -> List[str]:
-    keys: List[str] = []
-    for c in SystemMessageStore().roles.keys():
-        for v in SystemMessageStore._BASE_VARIANTS.keys():
-            keys.append(f"{c}.{v}")
-    return keys
+    return list(SystemMessageStore._ALL_KEYS)
 
 
 # ---------------- Example usage ----------------
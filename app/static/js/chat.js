@@ -79,13 +79,34 @@
     });
   }
 
+  // Why: server speaks JSON over binary frames (orjson on the wire)
+  const encoder = new TextEncoder();
+  const decoder = new TextDecoder();
+  function wsSend(obj){
+    state.ws.send(encoder.encode(JSON.stringify(obj)));
+  }
+
+  // Server frames: 1 header byte (0x00 raw, 0x01 deflate-compressed) followed by JSON
+  async function decodeFrame(buf){
+    const bytes = new Uint8Array(buf);
+    const body = bytes.subarray(1);
+    if(bytes[0] === 1){
+      const stream = new Blob([body]).stream().pipeThrough(new DecompressionStream("deflate"));
+      return decoder.decode(await new Response(stream).arrayBuffer());
+    }
+    return decoder.decode(body);
+  }
+  // Why: decompression is async; chain frames so events are handled in arrival order
+  let inbound = Promise.resolve();
+
   function connect(){
     if(state.connected) return;
     state.ws = new WebSocket(wsUrl());
+    state.ws.binaryType = "arraybuffer";
     state.ws.onopen = () => {
       state.connected = true;
       state.reconnectAttempts = 0;
-      state.ws.send(JSON.stringify({ type: "cw_chat_hello", session_id: state.sessionId }));
+      wsSend({ type: "cw_chat_hello", session_id: state.sessionId });
     };
     state.ws.onclose = () => {
       state.connected = false;
@@ -95,12 +116,16 @@
       setTimeout(connect, delay);
     };
     state.ws.onmessage = (ev) => {
-      try{
-        const msg = JSON.parse(ev.data);
-        handleServerEvent(msg);
-      }catch(e){
-        renderError("Malformed server message.");
-      }
+      inbound = inbound.then(async () => {
+        try{
+          const msg = JSON.parse(typeof ev.data === "string" ? ev.data : await decodeFrame(ev.data));
+          // Why: server batches queued events into one array frame
+          if(Array.isArray(msg)) msg.forEach(handleServerEvent);
+          else handleServerEvent(msg);
+        }catch(e){
+          renderError("Malformed server message.");
+        }
+      });
     };
     state.ws.onerror = () => {
       renderError("WebSocket error.");
@@ -160,7 +185,7 @@
       };
       state.pendingFile = null;
     }
-    state.ws.send(JSON.stringify({ type: "user_message", text, file: filePayload }));
+    wsSend({ type: "user_message", text, file: filePayload });
     renderTyping(true);
   }
 
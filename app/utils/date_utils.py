@@ -1,18 +1,51 @@
 import datetime
-from typing import Optional
+import functools
+import re
+import time
+from typing import Dict, Optional, Tuple
 from datetime import date, datetime, timezone as dt_timezone
-from zoneinfo import ZoneInfo  # py>=3.9
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError  # py>=3.9
+
+NOW_ISO_GRANULARITY = 0.001  # seconds
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}|\d{8}")  # extended or compact ISO calendar date
+TODAY_CACHE_TTL = 60.0  # seconds
+_TODAY_CACHE: Dict[str, Tuple[float, str]] = {}  # tz -> (monotonic time computed, ISO date)
+
+
+@functools.lru_cache(maxsize=64)
+def _zone_info(name: str) -> ZoneInfo:
+    """why: resolve each IANA zone once; renders call this on every prompt build."""
+    return ZoneInfo(name)
+
 
 class DateUtil:
+    _now_iso_cache: Tuple[float, str] = (0.0, "")
+
     @classmethod
     def now_datetime_iso(cls) -> str:
-        return datetime.now(dt_timezone.utc).isoformat()
+        """why: WS hot path stamps several messages per event; reuse the string within the same millisecond."""
+        t = time.time()
+        last_t, last_s = cls._now_iso_cache
+        if 0.0 <= t - last_t < NOW_ISO_GRANULARITY:
+            return last_s
+        s = datetime.fromtimestamp(t, dt_timezone.utc).isoformat()
+        cls._now_iso_cache = (t, s)
+        return s
 
     @classmethod
     def iso_date_or_default(cls, value: Optional[str], *, default: str) -> str:
         """why: keep rendering robust even if upstream passes a bad date."""
         if not value:
             return default
+        if isinstance(value, str):
+            # Why: reject non-date strings without raising; a well-formed YYYY-MM-DD is already canonical
+            if not _ISO_DATE_RE.fullmatch(value):
+                return default
+            try:
+                parsed = date.fromisoformat(value)  # still rejects out-of-range parts like 2025-13-01
+            except ValueError:
+                return default
+            return value if len(value) == 10 else parsed.isoformat()  # compact YYYYMMDD -> YYYY-MM-DD
         try:
             return date.fromisoformat(str(value)).isoformat()
         except (TypeError, ValueError):
@@ -20,24 +53,35 @@ class DateUtil:
 
     @classmethod
     def now_date_iso(cls, tz: str = "UTC") -> str:
-        """why: align 'today' with business TZ to prevent off-by-one errors."""
+        """
+        why: align 'today' with business TZ to prevent off-by-one errors.
+        Cached per tz for TODAY_CACHE_TTL seconds, so just after midnight it may still return
+        the previous date for up to a minute.
+        """
+        now = time.monotonic()
+        cached = _TODAY_CACHE.get(tz)
+        if cached is not None and now - cached[0] < TODAY_CACHE_TTL:
+            return cached[1]
         tz_info = dt_timezone.utc
         if ZoneInfo is not None:
             try:
-                tz_info = ZoneInfo(cls.normalize_timezone(tz))
-            except (TypeError, ValueError):
+                tz_info = _zone_info(cls.normalize_timezone(tz))
+            except (TypeError, ValueError, ZoneInfoNotFoundError):
                 tz_info = dt_timezone.utc
-        return datetime.now(tz_info).date().isoformat()
+        today = datetime.now(tz_info).date().isoformat()
+        _TODAY_CACHE[tz] = (now, today)
+        return today
 
 
     @classmethod
+    @functools.lru_cache(maxsize=64)
     def normalize_timezone(cls, value: Optional[str]) -> str:
-        """why: avoid breaking on bad tz strings; default to UTC."""
+        """why: avoid breaking on bad tz strings; default to UTC. Cached: inputs are a handful of zone names."""
         tz = (value or "UTC").strip() or "UTC"
         if ZoneInfo is None:
             return "UTC" if tz.upper() in {"Z", "UTC"} else tz  # best-effort without validation
         try:
-            ZoneInfo(tz)  # validate existence
+            _zone_info(tz)  # validate existence
             return tz
-        except (TypeError, ValueError):
+        except (TypeError, ValueError, ZoneInfoNotFoundError):
             return "UTC"
\ No newline at end of file
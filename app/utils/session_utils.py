@@ -1,18 +1,30 @@
 import asyncio
-from typing import Optional
-import uuid
-from fastapi import Response, WebSocket
+import contextlib
+import os
+import secrets
+from typing import Any, AsyncGenerator, Optional
+import zlib
+import orjson
+from fastapi import Response, WebSocket, WebSocketDisconnect
 
 SESSION_COOKIE_NAME = "chat_session_id"
 SESSION_COOKIE_MAX_AGE = 60 * 60 * 24 * 7  # 7 days
 SESSION_ID_LENGTH = 64
+WS_OUTBOX_SIZE = 256
+# Outbound frame header: 1 byte flag, then JSON (raw or zlib/deflate compressed)
+WS_FRAME_RAW = b"\x00"
+WS_FRAME_COMPRESSED = b"\x01"
+WS_COMPRESS_THRESHOLD = 256  # bytes
+# Single switch read by both the runner (uvicorn ws_per_message_deflate) and the writer. Off by default: tiny
+# ack/typing frames skip deflate and only frames over WS_COMPRESS_THRESHOLD are compressed by the app.
+# Opting in hands all compression to the protocol layer so nothing is compressed twice.
+WS_PER_MESSAGE_DEFLATE = os.getenv("CW_CHAT_WS_PER_MESSAGE_DEFLATE", "0") == "1"
 
 class SessionUtils:
     @classmethod
     def get_or_create_session_id(cls, session_id: Optional[str]) -> str:
-        if session_id and len(session_id) <= SESSION_ID_LENGTH:
-            return session_id
-        return uuid.uuid4().hex
+        # Why: token_hex reads os.urandom straight into 32 hex chars; no UUID object per new visitor
+        return session_id if session_id and len(session_id) <= SESSION_ID_LENGTH else secrets.token_hex(16)
 
     @classmethod
     def set_session_cookie(cls, resp: Response, session_id: str) -> None:
@@ -28,22 +40,93 @@ class SessionUtils:
         )
 
     @classmethod
-    async def stream_assistant(cls, ws: WebSocket, full_text: str):
-        """
-        Chunk text to simulate streaming; your LLM stream goes here.
-        Why: Better UX + typing indicator parity.
-        """
-        chunks = []
-        words = full_text.split()
-        buf = []
-        for w in words:
-            buf.append(w)
-            if len(buf) >= 4:
-                chunks.append(" ".join(buf) + " ")
-                buf = []
-        if buf:
-            chunks.append(" ".join(buf))
-        for c in chunks:
-            await ws.send_json({"type": "token", "data": c})
-            await asyncio.sleep(0.05)
-        await ws.send_json({"type": "done"})
\ No newline at end of file
+    async def ws_receive(cls, ws: WebSocket) -> Any:
+        """
+        Why: orjson decodes binary frames several times faster than Starlette's stdlib json, and binary
+        frames skip the server's UTF-8 validation (orjson validates anyway). Text frames from older
+        clients are still accepted.
+        """
+        message = await ws.receive()
+        if message["type"] == "websocket.disconnect":
+            raise WebSocketDisconnect(message["code"], message.get("reason"))
+        data = message.get("bytes")
+        return orjson.loads(data if data is not None else message["text"])
+
+    @classmethod
+    async def ws_writer(cls, ws: WebSocket, out_q: asyncio.Queue) -> None:
+        """
+        Single writer per connection: drain everything queued and send it as one JSON array frame.
+        Why: one send/drain per burst instead of one per event; a None frame stops the writer.
+        """
+        compress = not WS_PER_MESSAGE_DEFLATE
+        while True:
+            frame = await out_q.get()
+            if frame is None:
+                return
+            frames = [frame]
+            stop = False
+            while not out_q.empty():
+                frame = out_q.get_nowait()
+                if frame is None:
+                    stop = True
+                    break
+                frames.append(frame)
+            await ws.send_bytes(cls._encode_frame(frames, compress))
+            if stop:
+                return
+
+    @classmethod
+    def _encode_frame(cls, frames: list, compress: bool = True) -> bytes:
+        """Why: acks/typing pings are tiny; only compress payloads large enough to benefit."""
+        payload = orjson.dumps(frames)
+        if compress and len(payload) > WS_COMPRESS_THRESHOLD:
+            return WS_FRAME_COMPRESSED + zlib.compress(payload)
+        return WS_FRAME_RAW + payload
+
+    @classmethod
+    async def outbox_put(cls, out_q: asyncio.Queue, writer: asyncio.Task, frame: Any) -> None:
+        """
+        Queue a frame for the writer task.
+        Why: if the writer died (e.g. send failed on a closed socket) nobody drains the queue; raise the
+        writer's error instead of blocking forever once the outbox is full.
+        """
+        if not writer.done():
+            try:
+                out_q.put_nowait(frame)
+                return
+            except asyncio.QueueFull:
+                put = asyncio.ensure_future(out_q.put(frame))
+                await asyncio.wait((put, writer), return_when=asyncio.FIRST_COMPLETED)
+                if put.done():
+                    put.result()
+                    return
+                put.cancel()
+        writer.result()  # re-raises the send error (or CancelledError)
+        raise RuntimeError("WebSocket outbox writer has stopped.")
+
+    @classmethod
+    async def close_outbox(cls, out_q: asyncio.Queue, writer: asyncio.Task, *frames: Any) -> None:
+        """Queue the final frames, flush the outbox and wait for the writer to stop."""
+        if not writer.done():
+            for frame in frames:
+                await out_q.put(frame)
+            await out_q.put(None)
+        with contextlib.suppress(Exception):
+            await writer
+
+    @classmethod
+    async def stream_tokens(
+            cls, out_q: asyncio.Queue, writer: asyncio.Task, tokens: AsyncGenerator[str, None]
+    ) -> str:
+        """
+        Forward LLM tokens to the client as they arrive and return the full reply.
+        Why: first token reaches the client immediately; the writer task coalesces bursts.
+        The token stream is closed on any error so a dead socket doesn't leave the LLM request open.
+        """
+        parts = []
+        async with contextlib.aclosing(tokens):
+            async for token in tokens:
+                parts.append(token)
+                await cls.outbox_put(out_q, writer, {"type": "token", "data": token})
+        await cls.outbox_put(out_q, writer, {"type": "done"})
+        return "".join(parts)
@@ -3,47 +3,56 @@ import os
 class StringUtils:
     @classmethod
     def get_file_paths(cls, path: str, recursive: bool = False, file_filter: dict = None) -> list:
-        file_paths = []
-
-        def matches_filter(file_path):
-            if not os.path.exists(file_path):
+        # Why: resolve the filter once, not per file (no .lower()/.timestamp() in the scan loop)
+        file_filter = file_filter or {}
+        extension = file_filter.get('extension')
+        if isinstance(extension, (list, tuple)):
+            extension = tuple(ext.lower() for ext in extension)
+        elif extension is not None:
+            extension = extension.lower()
+        after_ts = file_filter['after_date'].timestamp() if 'after_date' in file_filter else None
+        before_ts = file_filter['before_date'].timestamp() if 'before_date' in file_filter else None
+        size_limit = file_filter.get('size')
+        # Only date/size filters need a stat(); extension-only or no filter costs no syscall per file
+        needs_stat = after_ts is not None or before_ts is not None or size_limit is not None
+
+        def matches_filter(name, stat):
+            if extension is not None and not name.lower().endswith(extension):
                 return False
-
-            if file_filter is None:
+            if not needs_stat:
                 return True
-
-            if 'extension' in file_filter:
-                if not file_path.lower().endswith(file_filter['extension'].lower()):
-                    return False
-
-            if 'after_date' in file_filter:
-                if os.path.getmtime(file_path) < file_filter['after_date'].timestamp():
-                    return False
-
-            if 'before_date' in file_filter:
-                if os.path.getmtime(file_path) > file_filter['before_date'].timestamp():
-                    return False
-
-            if 'size' in file_filter:
-                if os.path.getsize(file_path) > file_filter['size']:
-                    return False
-
+            st = stat()
+            if after_ts is not None and st.st_mtime < after_ts:
+                return False
+            if before_ts is not None and st.st_mtime > before_ts:
+                return False
+            if size_limit is not None and st.st_size > size_limit:
+                return False
             return True
 
-        recursive = False if os.path.isfile(path) else recursive
-
-        if recursive:
-            for root, _, files in os.walk(path):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    if file_filter is not None or matches_filter(file_path):
-                        file_paths.append(file_path)
-        else:
-            if os.path.isdir(path):
-                for file in os.listdir(path):
-                    full_path = os.path.join(path, file)
-                    if os.path.isfile(full_path) and (file_filter is None or matches_filter(full_path)):
-                        file_paths.append(full_path)
-            elif os.path.isfile(path) and (file_filter is None or matches_filter(path)):
-                file_paths.append(path)
-        return file_paths
+        def scan(dir_path, top=True):
+            # Why: DirEntry caches its stat, so each file costs one syscall instead of exists/getmtime/getsize
+            sub_dirs = []
+            try:
+                entries = os.scandir(dir_path)
+            except OSError:
+                # Same as before: os.walk (recursive) skips directories it can't list, os.listdir raises
+                if top and not recursive:
+                    raise
+                return
+            with entries:
+                for entry in entries:
+                    if entry.is_file():
+                        if matches_filter(entry.name, entry.stat):
+                            yield entry.path
+                    elif recursive and entry.is_dir(follow_symlinks=False):
+                        sub_dirs.append(entry.path)
+            # Same top-down order as os.walk: a directory's files before its sub-directories
+            for sub_dir in sub_dirs:
+                yield from scan(sub_dir, top=False)
+
+        if os.path.isdir(path):
+            return list(scan(path))
+        if os.path.isfile(path) and matches_filter(os.path.basename(path), lambda: os.stat(path)):
+            return [path]
+        return []
@@ -1,3 +1,12 @@
+import asyncio
+import logging
+import zipfile
+
+import pytest
+from langchain_community.document_loaders import PyMuPDFLoader, PyPDFLoader
+from langchain_core.documents import Document
+
+from app.services import file_loader_service
 from app.services.file_loader_service import FileLoadService, FILE_TYPE
 
 
@@ -13,6 +22,11 @@ def test_get_ext_by_type():
     assert file_load_service.get_file_type_by_ext('xlsx') == FILE_TYPE.MS_EXCEL
     assert file_load_service.get_file_type_by_ext('ppt') == FILE_TYPE.MS_POWERPOINT
     assert file_load_service.get_file_type_by_ext('pptx') == FILE_TYPE.MS_POWERPOINT
+    assert file_load_service.get_file_type_by_ext('zip') == FILE_TYPE.ZIP
+
+    # Test dotted extensions (as returned by os.path.splitext)
+    assert file_load_service.get_file_type_by_ext('.txt') == FILE_TYPE.TEXT
+    assert file_load_service.get_file_type_by_ext('.docx') == FILE_TYPE.MS_WORD
 
     # Test invalid extensions
     assert file_load_service.get_file_type_by_ext('invalid') is None
@@ -21,3 +35,72 @@ def test_get_ext_by_type():
 def test_load_zip_file():
     file_load_service = FileLoadService()
     file_load_service.load('/Users/scha/Downloads/OneDrive_2_2025-12-01.zip')
+
+def test_load_all_text_files(tmp_path):
+    (tmp_path / 'a.txt').write_text('alpha', encoding='utf-8')
+    (tmp_path / 'b.txt').write_text('beta', encoding='utf-8')
+
+    file_load_service = FileLoadService()
+    documents = asyncio.run(file_load_service.load_all(str(tmp_path)))
+
+    assert sorted(doc.page_content for doc in documents) == ['alpha', 'beta']
+
+def test_load_zip_skips_unsupported_entries(tmp_path):
+    zip_path = tmp_path / 'docs.zip'
+    with zipfile.ZipFile(zip_path, 'w') as zip_ref:
+        zip_ref.writestr('notes/readme.txt', 'hello zip')
+        zip_ref.writestr('image.png', b'\x89PNG')
+
+    file_load_service = FileLoadService()
+    documents = file_load_service.load(str(zip_path))
+
+    assert [doc.page_content for doc in documents] == ['hello zip']
+
+def _fake_loader(calls, name):
+    class _Loader:
+        def __init__(self, file_path, **kwargs):
+            self.file_path = file_path
+
+        def load(self):
+            calls.append((name, self.file_path))
+            return [Document(page_content=self.file_path)]
+
+    return _Loader
+
+def test_load_dispatches_word_and_pdf_loaders(monkeypatch):
+    calls = []
+    monkeypatch.setattr(file_loader_service, 'UnstructuredWordDocumentLoader', _fake_loader(calls, 'word'))
+    monkeypatch.setitem(file_loader_service.PDF_LOADERS, 'pypdf', _fake_loader(calls, 'pdf'))
+    monkeypatch.setattr(file_loader_service, 'PDF_BACKEND', 'pypdf')
+    file_load_service = FileLoadService()
+
+    for path in ('/no/such/dir/report.docx', '/no/such/dir/legacy.doc', '/no/such/dir/scan.pdf'):
+        assert [doc.page_content for doc in file_load_service.load(path)] == [path]
+
+    assert calls == [
+        ('word', '/no/such/dir/report.docx'),
+        ('word', '/no/such/dir/legacy.doc'),
+        ('pdf', '/no/such/dir/scan.pdf'),
+    ]
+
+def test_load_skips_unsupported_extension(monkeypatch):
+    calls = []
+    monkeypatch.setattr(file_loader_service, 'UnstructuredWordDocumentLoader', _fake_loader(calls, 'word'))
+
+    assert FileLoadService().load('/no/such/dir/image.png') == []
+    assert calls == []
+
+@pytest.mark.parametrize('backend, expected', [('pypdf', PyPDFLoader), ('pymupdf', PyMuPDFLoader)])
+def test_pdf_backend_selects_loader(monkeypatch, caplog, backend, expected):
+    monkeypatch.setattr(file_loader_service, 'PDF_BACKEND', backend)
+
+    assert FileLoadService().pdf_loader is expected
+    assert 'PDF_BACKEND' not in caplog.text
+
+def test_unknown_pdf_backend_warns_and_falls_back(monkeypatch, caplog):
+    monkeypatch.setattr(file_loader_service, 'PDF_BACKEND', 'pymupdf4')
+
+    with caplog.at_level(logging.WARNING):
+        assert FileLoadService().pdf_loader is PyPDFLoader
+
+    assert "unknown PDF_BACKEND 'pymupdf4'" in caplog.text
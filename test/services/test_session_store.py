@@ -0,0 +1,125 @@
+import asyncio
+from dataclasses import asdict
+from unittest.mock import AsyncMock, MagicMock, call
+
+import orjson
+
+from app.models.chat_message import ChatMessage
+from app.services.session_store import SESSION_KEY_PREFIX, SESSION_MAX_MESSAGES, SESSION_TTL_SECONDS, SessionStore
+
+
+class _FakePipeline:
+    def __init__(self, client, transaction):
+        self.client = client
+        self.transaction = transaction
+        self.calls = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def rpush(self, key, *values):
+        self.calls.append(('rpush', key, *values))
+
+    def ltrim(self, key, start, end):
+        self.calls.append(('ltrim', key, start, end))
+
+    def expire(self, key, seconds):
+        self.calls.append(('expire', key, seconds))
+
+    async def execute(self):
+        for name, key, *args in self.calls:
+            items = self.client.lists.setdefault(key, [])
+            if name == 'rpush':
+                items.extend(args)
+            elif name == 'ltrim':
+                start, end = args
+                self.client.lists[key] = items[start:len(items) + end + 1 if end < 0 else end + 1]
+
+
+class _FakeRedis:
+    """In-memory stand-in for the redis.asyncio client calls SessionStore makes."""
+
+    def __init__(self):
+        self.lists = {}
+        self.pipelines = []
+
+    def pipeline(self, transaction=True):
+        pipe = _FakePipeline(self, transaction)
+        self.pipelines.append(pipe)
+        return pipe
+
+    async def lrange(self, key, start, end):
+        assert (start, end) == (0, -1)
+        return list(self.lists.get(key, []))
+
+
+def _message(i, **kwargs):
+    return ChatMessage(role='user' if i % 2 == 0 else 'assistant', content=f'message {i}', at='2025-11-10T00:00:00', **kwargs)
+
+
+def test_append_then_get_history_round_trips_in_order():
+    store = SessionStore(_FakeRedis())
+    first = [_message(0), _message(1, meta={'kind': 'file-receipt'})]
+
+    async def run():
+        await store.append('sid', *first)
+        await store.append('sid', _message(2))
+        return await store.get_history('sid')
+
+    assert asyncio.run(run()) == [*first, _message(2)]
+
+
+def test_append_without_messages_skips_redis():
+    client = _FakeRedis()
+
+    asyncio.run(SessionStore(client).append('sid'))
+
+    assert client.pipelines == []
+    assert client.lists == {}
+
+
+def _mocked_client():
+    client = MagicMock()
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    client.pipeline.return_value.__aenter__.return_value = pipe
+    return client, pipe
+
+
+def test_append_batches_a_turn_into_one_pipeline():
+    client, pipe = _mocked_client()
+    messages = [_message(0), _message(1), _message(2)]
+
+    asyncio.run(SessionStore(client).append('sid', *messages))
+
+    client.pipeline.assert_called_once_with(transaction=False)
+    key = f'{SESSION_KEY_PREFIX}sid'
+    assert pipe.rpush.call_args_list == [call(key, orjson.dumps(asdict(m))) for m in messages]
+    pipe.expire.assert_called_once_with(key, SESSION_TTL_SECONDS)
+    assert SESSION_TTL_SECONDS == 3600
+    pipe.execute.assert_awaited_once()
+
+
+def test_append_trims_to_max_messages_after_pushing():
+    client, pipe = _mocked_client()
+
+    asyncio.run(SessionStore(client).append('sid', _message(0), _message(1)))
+
+    names = [name for name, *_ in pipe.mock_calls if name in ('rpush', 'ltrim', 'expire')]
+    assert names == ['rpush', 'rpush', 'ltrim', 'expire']
+    pipe.ltrim.assert_called_once_with(f'{SESSION_KEY_PREFIX}sid', -SESSION_MAX_MESSAGES, -1)
+
+
+def test_get_history_keeps_newest_max_messages():
+    store = SessionStore(_FakeRedis())
+    messages = [_message(i) for i in range(SESSION_MAX_MESSAGES + 5)]
+
+    async def run():
+        await store.append('sid', *messages[:3])
+        await store.append('sid', *messages[3:])
+        return await store.get_history('sid')
+
+    assert asyncio.run(run()) == messages[-SESSION_MAX_MESSAGES:]
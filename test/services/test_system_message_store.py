@@ -0,0 +1,151 @@
+from dataclasses import asdict
+
+import pytest
+
+from app.services.system_message_store import SystemMessageStore, TemplateParam, _compliance_line
+
+
+def _render(store, key='sales.concise', **kwargs):
+    return store.render_content(key, knowledge_cutoff='2025-06-01', today='2025-11-10', **kwargs)
+
+
+def test_render_content_is_memoized():
+    SystemMessageStore.clear_cache()
+    store = SystemMessageStore()
+
+    first = _render(store, max_words=80)
+    second = _render(SystemMessageStore(), max_words=80)
+
+    assert first is second
+    assert '≤ 80 words' in first
+
+
+def test_clear_cache_rerenders():
+    store = SystemMessageStore()
+    first = _render(store)
+
+    SystemMessageStore.clear_cache()
+    second = _render(store)
+
+    assert first == second
+    assert first is not second
+
+
+def test_render_content_with_unhashable_extra():
+    store = SystemMessageStore()
+
+    content = _render(store, 'sales.discovery_first', service='Payroll', tags=['a', 'b'])
+
+    assert 'Payroll' in content
+
+
+def test_template_param_to_kwargs():
+    param = TemplateParam.from_partial(
+        {'company': 'Acme', 'product': 'P', 'service': 'S', 'jurisdiction': 'SOX', 'policy_url': ''},
+        timezone='America/Toronto',
+    )
+
+    kwargs = param.to_kwargs(extra={'policy_url': 'https://policy', 'locale': 'fr', 'company': 'Other'})
+
+    assert kwargs == {**asdict(param), 'policy_url': 'https://policy', 'locale': 'fr'}
+
+
+def test_render_content_keeps_every_variant():
+    content = _render(SystemMessageStore(), 'sales.concise.no_hallucinations', max_words=60)
+
+    assert '≤ 60 words' in content
+    assert "I don't know" in content
+    assert '  ' not in content
+
+
+def test_render_content_without_variants():
+    content = _render(SystemMessageStore(), 'hr')
+
+    assert content.endswith('Today=2025-11-10 UTC.')
+
+
+def test_compiled_variants_match_str_format():
+    fmt_kwargs = {'max_words': 42, 'locale': 'fr', 'default_language': 'en', 'company': 'Acme', 'product': 'P',
+                  'service': 'S'}
+
+    assert SystemMessageStore._COMPILED_VARIANTS
+    for template, compiled in SystemMessageStore._COMPILED_VARIANTS.items():
+        assert compiled(**fmt_kwargs) == template.format(**fmt_kwargs)
+
+
+def test_render_system_message_is_shared():
+    store = SystemMessageStore()
+
+    first = store.render_system_message('engineering.concise', knowledge_cutoff='2025-06-01', today='2025-11-10')
+    second = store.render_system_message('engineering.concise', knowledge_cutoff='2025-06-01', today='2025-11-10')
+
+    assert first is second
+    assert first.content == _render(store, 'engineering.concise')
+
+
+def test_build_prompt_from_key_is_shared():
+    store = SystemMessageStore()
+    render_kwargs = {'knowledge_cutoff': '2025-06-01', 'today': '2025-11-10'}
+
+    first = store.build_prompt_from_key('sales.concise', **render_kwargs)
+    second = store.build_prompt_from_key('sales.concise', **render_kwargs)
+
+    assert first is second
+    messages = first.invoke({'input': 'Hello', 'history': []}).to_messages()
+    assert messages[0].content == _render(store)
+    assert messages[-1].content == 'Hello'
+
+
+def test_render_content_empty_names_use_defaults():
+    store = SystemMessageStore()
+
+    assert _render(store, company='', industry='', business_area='') == _render(store)
+
+
+def test_catalogs_are_read_only():
+    with pytest.raises(TypeError):
+        SystemMessageStore._BASE_VARIANTS['concise'] = ''
+    with pytest.raises(TypeError):
+        SystemMessageStore._EXTRA_VARIANTS['hr']['neutral_tone'] = ''
+    with pytest.raises(TypeError):
+        SystemMessageStore._MERGED_VARIANTS['sales']['concise'] = ''
+
+
+def test_keys_cover_base_and_role_variants():
+    keys = SystemMessageStore().keys()
+
+    assert 'sales.concise' in keys
+    assert 'hr.neutral_tone' in keys
+    assert 'sales.neutral_tone' not in keys
+    assert len(keys) == len(set(keys))
+    for key in keys:
+        assert _render(SystemMessageStore(), key, max_words=50, locale='fr', default_language='en')
+
+
+def test_compliance_line_variants():
+    assert _compliance_line('SOX', 'https://p') == ' Comply with SOX policies and https://p.'
+    assert _compliance_line('SOX', None) == ' Comply with SOX policies.'
+    assert _compliance_line('', 'https://p') == ' Follow internal policies: https://p.'
+    assert _compliance_line(None, None) == ''
+    assert _compliance_line('SOX', None) is _compliance_line('SOX', None)
+
+
+def test_template_param_from_partial_merges_and_normalizes():
+    param = TemplateParam.from_partial(
+        {'company': 'Acme', 'product': 'P', 'service': 'S', 'jurisdiction': 'SOX', 'policy_url': '', 'unknown': 1,
+         'timezone': 'Mars/Olympus_Mons', 'knowledge_cutoff': 'soon'},
+        product='Override',
+        today='2025-11-10',
+    )
+
+    assert param.product == 'Override'
+    assert param.timezone == 'UTC'
+    assert param.knowledge_cutoff == '1970-01-01'
+    assert param.today == '2025-11-10'
+
+
+def test_template_param_is_slotted():
+    param = TemplateParam.from_partial({'company': 'A', 'product': 'P', 'service': 'S', 'jurisdiction': '', 'policy_url': ''})
+
+    assert not hasattr(param, '__dict__')
+    assert TemplateParam._FIELD_NAMES == tuple(TemplateParam.__slots__)
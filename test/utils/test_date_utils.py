@@ -0,0 +1,42 @@
+import time
+from datetime import date
+
+from app.utils import date_utils
+from app.utils.date_utils import DateUtil
+
+
+def test_normalize_timezone():
+    assert DateUtil.normalize_timezone('America/Toronto') == 'America/Toronto'
+    assert DateUtil.normalize_timezone(' UTC ') == 'UTC'
+    assert DateUtil.normalize_timezone(None) == 'UTC'
+    assert DateUtil.normalize_timezone('') == 'UTC'
+
+    # Unknown zones fall back to UTC instead of raising
+    assert DateUtil.normalize_timezone('Mars/Olympus_Mons') == 'UTC'
+
+
+def test_now_date_iso_with_unknown_timezone():
+    assert DateUtil.now_date_iso('Mars/Olympus_Mons') == DateUtil.now_date_iso('UTC')
+
+
+def test_iso_date_or_default():
+    assert DateUtil.iso_date_or_default('2025-06-01', default='x') == '2025-06-01'
+    assert DateUtil.iso_date_or_default('20250601', default='x') == '2025-06-01'
+    assert DateUtil.iso_date_or_default('2025-13-01', default='x') == 'x'
+    assert DateUtil.iso_date_or_default('20251301', default='x') == 'x'
+    # Week dates are no longer accepted by the fast path
+    assert DateUtil.iso_date_or_default('2025-W23-1', default='x') == 'x'
+    assert DateUtil.iso_date_or_default('2025-06-01\n', default='x') == 'x'
+    assert DateUtil.iso_date_or_default('June 1', default='x') == 'x'
+    assert DateUtil.iso_date_or_default(None, default='x') == 'x'
+    assert DateUtil.iso_date_or_default(date(2025, 6, 1), default='x') == '2025-06-01'
+
+
+def test_now_date_iso_is_cached_per_timezone(monkeypatch):
+    monkeypatch.setattr(date_utils, '_TODAY_CACHE', {'America/Toronto': (time.monotonic(), '2000-01-01')})
+
+    assert DateUtil.now_date_iso('America/Toronto') == '2000-01-01'
+    assert DateUtil.now_date_iso('UTC') != '2000-01-01'
+
+    date_utils._TODAY_CACHE['America/Toronto'] = (time.monotonic() - date_utils.TODAY_CACHE_TTL, '2000-01-01')
+    assert DateUtil.now_date_iso('America/Toronto') != '2000-01-01'
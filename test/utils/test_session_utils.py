@@ -0,0 +1,134 @@
+import asyncio
+import zlib
+
+import orjson
+import pytest
+from fastapi import WebSocketDisconnect
+
+from app.utils.session_utils import (
+    SESSION_ID_LENGTH, WS_COMPRESS_THRESHOLD, WS_FRAME_COMPRESSED, WS_FRAME_RAW, WS_OUTBOX_SIZE,
+    WS_PER_MESSAGE_DEFLATE, SessionUtils,
+)
+
+
+def _drain(out_q):
+    frames = []
+    while not out_q.empty():
+        frames.append(out_q.get_nowait())
+    return frames
+
+
+class _ClosedSocket:
+    async def send_bytes(self, data):
+        raise ConnectionResetError('client went away')
+
+
+def test_stream_tokens_forwards_tokens_and_returns_reply():
+    async def tokens():
+        for token in ('Hello ', 'there', '!'):
+            yield token
+
+    async def run():
+        out_q = asyncio.Queue()
+        writer = asyncio.get_running_loop().create_future()  # stands in for a live writer task
+        reply = await SessionUtils.stream_tokens(out_q, writer, tokens())
+        return reply, _drain(out_q)
+
+    reply, frames = asyncio.run(run())
+
+    assert reply == 'Hello there!'
+    assert frames == [
+        {'type': 'token', 'data': 'Hello '}, {'type': 'token', 'data': 'there'}, {'type': 'token', 'data': '!'},
+        {'type': 'done'},
+    ]
+
+
+def test_get_or_create_session_id():
+    assert SessionUtils.get_or_create_session_id('abc') == 'abc'
+
+    created = SessionUtils.get_or_create_session_id('x' * (SESSION_ID_LENGTH + 1))
+    assert len(created) == 32
+    int(created, 16)
+    assert SessionUtils.get_or_create_session_id(None) != SessionUtils.get_or_create_session_id('')
+
+
+def test_stream_tokens_raises_when_writer_dies():
+    closed = []
+
+    async def tokens():
+        try:
+            for i in range(600):  # more than WS_OUTBOX_SIZE frames
+                yield f'w{i} '
+        finally:
+            closed.append(True)
+
+    async def run():
+        out_q = asyncio.Queue(maxsize=WS_OUTBOX_SIZE)
+        writer = asyncio.create_task(SessionUtils.ws_writer(_ClosedSocket(), out_q))
+        await asyncio.wait_for(SessionUtils.stream_tokens(out_q, writer, tokens()), timeout=5)
+
+    with pytest.raises(ConnectionResetError):
+        asyncio.run(run())
+    assert closed == [True]
+
+
+class _FakeSocket:
+    def __init__(self, *messages):
+        self.messages = list(messages)
+
+    async def receive(self):
+        return self.messages.pop(0)
+
+
+def test_encode_frame_raw_below_threshold():
+    frame = SessionUtils._encode_frame([{'type': 'ack'}])
+
+    assert frame[:1] == WS_FRAME_RAW
+    assert orjson.loads(frame[1:]) == [{'type': 'ack'}]
+
+
+def test_encode_frame_compresses_above_threshold():
+    frames = [{'type': 'token', 'data': 'x' * WS_COMPRESS_THRESHOLD}]
+
+    frame = SessionUtils._encode_frame(frames)
+    uncompressed = SessionUtils._encode_frame(frames, compress=False)
+
+    assert frame[:1] == WS_FRAME_COMPRESSED
+    assert orjson.loads(zlib.decompress(frame[1:])) == frames
+    assert uncompressed[:1] == WS_FRAME_RAW
+    assert orjson.loads(uncompressed[1:]) == frames
+
+
+def test_ws_receive_accepts_bytes_and_text_frames():
+    ws = _FakeSocket(
+        {'type': 'websocket.receive', 'bytes': b'{"type":"ping"}'},
+        {'type': 'websocket.receive', 'text': '{"type":"cw_chat_hello"}'},
+        {'type': 'websocket.disconnect', 'code': 1001},
+    )
+
+    assert asyncio.run(SessionUtils.ws_receive(ws)) == {'type': 'ping'}
+    assert asyncio.run(SessionUtils.ws_receive(ws)) == {'type': 'cw_chat_hello'}
+    with pytest.raises(WebSocketDisconnect):
+        asyncio.run(SessionUtils.ws_receive(ws))
+
+
+def test_ws_writer_uses_app_framing_by_default():
+    class _Socket:
+        def __init__(self):
+            self.sent = []
+
+        async def send_bytes(self, data):
+            self.sent.append(data)
+
+    async def run():
+        ws, out_q = _Socket(), asyncio.Queue()
+        for frame in ({'type': 'ack'}, None):
+            out_q.put_nowait(frame)
+        await SessionUtils.ws_writer(ws, out_q)
+        out_q.put_nowait({'type': 'token', 'data': 'x' * WS_COMPRESS_THRESHOLD})
+        out_q.put_nowait(None)
+        await SessionUtils.ws_writer(ws, out_q)
+        return ws.sent
+
+    assert not WS_PER_MESSAGE_DEFLATE
+    assert [frame[:1] for frame in asyncio.run(run())] == [WS_FRAME_RAW, WS_FRAME_COMPRESSED]
@@ -0,0 +1,71 @@
+import os
+
+import pytest
+
+from app.utils.string_utils import StringUtils
+
+
+def _touch(path, size=0):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b'x' * size)
+    return str(path)
+
+
+def test_get_file_paths_recursive_applies_filter(tmp_path):
+    top = _touch(tmp_path / 'a.TXT')
+    _touch(tmp_path / 'b.pdf')
+    nested = _touch(tmp_path / 'sub' / 'c.txt')
+    _touch(tmp_path / 'sub' / 'big.txt', size=100)
+
+    paths = StringUtils.get_file_paths(str(tmp_path), recursive=True, file_filter={'extension': '.txt', 'size': 10})
+
+    assert paths == [top, nested]
+
+
+def test_get_file_paths_non_recursive(tmp_path):
+    top = _touch(tmp_path / 'a.txt')
+    _touch(tmp_path / 'sub' / 'c.txt')
+
+    assert StringUtils.get_file_paths(str(tmp_path)) == [top]
+    assert StringUtils.get_file_paths(top, recursive=True) == [top]
+    assert StringUtils.get_file_paths(os.path.join(tmp_path, 'missing.txt')) == []
+
+
+def test_get_file_paths_with_extension_tuple(tmp_path):
+    txt = _touch(tmp_path / 'a.txt')
+    pdf = _touch(tmp_path / 'b.PDF')
+    _touch(tmp_path / 'c.docx')
+
+    paths = StringUtils.get_file_paths(str(tmp_path), file_filter={'extension': ['.TXT', '.pdf']})
+
+    assert sorted(paths) == sorted([txt, pdf])
+
+
+def test_get_file_paths_skips_unreadable_sub_directories(tmp_path, monkeypatch):
+    top = _touch(tmp_path / 'a.txt')
+    _touch(tmp_path / 'locked' / 'b.txt')
+    nested = _touch(tmp_path / 'open' / 'c.txt')
+    scandir = os.scandir
+
+    def fake_scandir(path):
+        if os.path.basename(path) == 'locked':
+            raise PermissionError(path)
+        return scandir(path)
+
+    monkeypatch.setattr(os, 'scandir', fake_scandir)
+
+    assert sorted(StringUtils.get_file_paths(str(tmp_path), recursive=True)) == sorted([top, nested])
+
+
+def test_get_file_paths_unreadable_or_missing_top_directory(tmp_path, monkeypatch):
+    _touch(tmp_path / 'a.txt')
+
+    def fake_scandir(path):
+        raise PermissionError(path)
+
+    monkeypatch.setattr(os, 'scandir', fake_scandir)
+
+    assert StringUtils.get_file_paths(str(tmp_path), recursive=True) == []
+    with pytest.raises(PermissionError):
+        StringUtils.get_file_paths(str(tmp_path))
+    assert StringUtils.get_file_paths(str(tmp_path / 'missing'), recursive=True) == []